@@ -25,6 +25,19 @@ MAX_SLUG_LENGTH = 30
 EXPECTED_ARGC = 2
 MAX_ARGC_WITH_TEST_PATH = 4  # <slug> --wrangler-toml-path <path>
 
+# wrangler.toml in the project root, which is 3 levels up from this script
+DEFAULT_WRANGLER_TOML_PATH = Path(__file__).parents[2] / "wrangler.toml"
+
+# Allowed worker name characters (no underscores for Workers)
+_SLUG_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+
+# Template names that a project must not keep as its worker name
+_RESERVED_SLUGS = frozenset({"turtlebased-ts", "turtlebased"})
+
+# Keys rewritten in wrangler.toml (name, database_name, bucket_name)
+_TOML_KEY_RE = re.compile(r'^(name|database_name|bucket_name)\s*=\s*"[^"]*"', re.MULTILINE)
+_TOML_TABLE_RE = re.compile(r"^\s*\[", re.MULTILINE)
+
 
 def validate_slug(slug: str) -> tuple[bool, str]:
     """Validate that the worker slug meets requirements.
@@ -35,6 +48,9 @@ def validate_slug(slug: str) -> tuple[bool, str]:
     - Cannot start or end with hyphen
     - Cannot be exactly 'turtlebased-ts' (template name)
 
+    Checks run from cheapest to most expensive, so the character scan only
+    runs once the constant-time checks have passed.
+
     Args:
         slug: The worker slug to validate
 
@@ -48,13 +64,6 @@ def validate_slug(slug: str) -> tuple[bool, str]:
     if len(slug) > MAX_SLUG_LENGTH:
         return False, f"Worker name must be at most {MAX_SLUG_LENGTH} characters long"
 
-    # Check characters (alphanumeric and hyphens only, no underscores for Workers)
-    if not re.match(r"^[a-z0-9-]+$", slug):
-        return (
-            False,
-            "Worker name must contain only lowercase letters, numbers, and hyphens",
-        )
-
     # Check start/end
     if slug.startswith("-"):
         return False, "Worker name cannot start with a hyphen"
@@ -62,12 +71,19 @@ def validate_slug(slug: str) -> tuple[bool, str]:
         return False, "Worker name cannot end with a hyphen"
 
     # Check reserved names
-    if slug in {"turtlebased-ts", "turtlebased"}:
+    if slug in _RESERVED_SLUGS:
         return (
             False,
             f"'{slug}' is a template name - please choose a unique worker name",
         )
 
+    # Check characters (alphanumeric and hyphens only, no underscores for Workers)
+    if not _SLUG_CHARS.issuperset(slug):
+        return (
+            False,
+            "Worker name must contain only lowercase letters, numbers, and hyphens",
+        )
+
     return True, ""
 
 
@@ -80,29 +96,24 @@ def replace_worker_name_in_toml(file_path: Path, new_slug: str) -> None:
     """
     content = file_path.read_text()
 
-    # Replace name = "..." field
-    content = re.sub(
-        r'^name\s*=\s*"[^"]*"',
-        f'name = "{new_slug}"',
-        content,
-        flags=re.MULTILINE,
-    )
-
-    # Replace database_name if it exists
-    content = re.sub(
-        r'^database_name\s*=\s*"[^"]*"',
-        f'database_name = "{new_slug}-db"',
-        content,
-        flags=re.MULTILINE,
-    )
-
-    # Replace R2 bucket binding name if it exists
-    content = re.sub(
-        r'^bucket_name\s*=\s*"[^"]*"',
-        f'bucket_name = "{new_slug}-storage"',
-        content,
-        flags=re.MULTILINE,
-    )
+    # The worker name is a top-level key; binding tables also use `name`
+    first_table = _TOML_TABLE_RE.search(content)
+    root_end = first_table.start() if first_table else len(content)
+
+    replacements = {
+        "name": new_slug,
+        "database_name": f"{new_slug}-db",
+        "bucket_name": f"{new_slug}-storage",
+    }
+
+    def replace_key(match: re.Match[str]) -> str:
+        key = match.group(1)
+        if key == "name" and match.start() >= root_end:
+            return match.group(0)
+        return f'{key} = "{replacements[key]}"'
+
+    # Rewrite name, database_name and bucket_name in a single scan
+    content = _TOML_KEY_RE.sub(replace_key, content)
 
     # Write back to file
     file_path.write_text(content)
@@ -126,9 +137,7 @@ def main() -> int:
     if len(sys.argv) >= MAX_ARGC_WITH_TEST_PATH and sys.argv[2] == "--wrangler-toml-path":
         wrangler_toml_path = Path(sys.argv[3])
     else:
-        # Find wrangler.toml (look in project root, which is 3 levels up from this script)
-        project_root = Path(__file__).parent.parent.parent
-        wrangler_toml_path = project_root / "wrangler.toml"
+        wrangler_toml_path = DEFAULT_WRANGLER_TOML_PATH
 
     # Validate the slug
     is_valid, error_message = validate_slug(new_slug)
@@ -9,67 +9,61 @@ Generates a project with DDD/Clean Architecture structure using:
 """
 
 import argparse
+import concurrent.futures
 import datetime
 import json
 import os
+import sys
 from pathlib import Path
 
+# Project file templates. package.json is serialized with json.dumps; text
+# templates rendered with str.format_map use {project_name}, {db} and
+# {today} placeholders and escape literal braces as {{ }}, and the rest are
+# written verbatim. Every template ends with exactly one newline, so
+# create_file writes content as-is.
+
+
+def _package_json(project_name: str, db: str) -> str:
+    """Render package.json for the project."""
+    package = {
+        "name": project_name,
+        "version": "0.0.1",
+        "private": True,
+        "type": "module",
+        "scripts": {
+            "dev": "wrangler dev",
+            "deploy": "wrangler deploy",
+            "test": "vitest",
+            "test:run": "vitest run",
+            "test:coverage": "vitest run --coverage",
+            "test:unit": r"vitest run --testPathPattern='\.spec\.ts$'",
+            "test:integration": r"vitest run --testPathPattern='\.integration\.test\.ts$'",
+            "test:acceptance": r"vitest run --testPathPattern='\.acceptance\.test\.ts$'",
+            "types": "wrangler types",
+            "db:migrate": f"wrangler d1 migrations apply {db}",
+            "db:migrate:local": f"wrangler d1 migrations apply {db} --local",
+            "css:build": "npx @tailwindcss/cli -i ./src/styles/app.css -o ./public/css/app.css --minify",
+            "css:watch": "npx @tailwindcss/cli -i ./src/styles/app.css -o ./public/css/app.css --watch",
+        },
+        "dependencies": {
+            "hono": "^4.12.0",
+        },
+        "devDependencies": {
+            "@cloudflare/vitest-pool-workers": "^0.8.0",
+            "@cloudflare/workers-types": "^4.20250109.0",
+            "@tailwindcss/cli": "^4.0.0",
+            "@tailwindcss/postcss": "^4.0.0",
+            "daisyui": "^5.0.0",
+            "tailwindcss": "^4.0.0",
+            "typescript": "^5.7.0",
+            "vitest": "^3.0.0",
+            "wrangler": "^3.99.0",
+        },
+    }
+    return json.dumps(package, indent=2) + "\n"
 
-def create_file(path: Path, content: str):
-    """Create a file with the given content."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content.strip() + "\n")
-    print(f"  ✓ {path}")
-
-
-def scaffold_project(project_name: str, output_dir: Path, db_name: str = None):
-    """Generate the complete project structure."""
-    root = output_dir / project_name
-    db = db_name or f"{project_name}-db"
-    today = datetime.date.today().isoformat()
-    
-    print(f"\n🚀 Scaffolding Cloudflare project: {project_name}")
-    print(f"   Output: {root}\n")
-    
-    # === Configuration Files ===
-    
-    create_file(root / "package.json", f'''{{
-  "name": "{project_name}",
-  "version": "0.0.1",
-  "private": true,
-  "type": "module",
-  "scripts": {{
-    "dev": "wrangler dev",
-    "deploy": "wrangler deploy",
-    "test": "vitest",
-    "test:run": "vitest run",
-    "test:coverage": "vitest run --coverage",
-    "test:unit": "vitest run --testPathPattern='\\\\.spec\\\\.ts$'",
-    "test:integration": "vitest run --testPathPattern='\\\\.integration\\\\.test\\\\.ts$'",
-    "test:acceptance": "vitest run --testPathPattern='\\\\.acceptance\\\\.test\\\\.ts$'",
-    "types": "wrangler types",
-    "db:migrate": "wrangler d1 migrations apply {db}",
-    "db:migrate:local": "wrangler d1 migrations apply {db} --local",
-    "css:build": "npx @tailwindcss/cli -i ./src/styles/app.css -o ./public/css/app.css --minify",
-    "css:watch": "npx @tailwindcss/cli -i ./src/styles/app.css -o ./public/css/app.css --watch"
-  }},
-  "dependencies": {{
-    "hono": "^4.12.0"
-  }},
-  "devDependencies": {{
-    "@cloudflare/vitest-pool-workers": "^0.8.0",
-    "@cloudflare/workers-types": "^4.20250109.0",
-    "@tailwindcss/cli": "^4.0.0",
-    "@tailwindcss/postcss": "^4.0.0",
-    "daisyui": "^5.0.0",
-    "tailwindcss": "^4.0.0",
-    "typescript": "^5.7.0",
-    "vitest": "^3.0.0",
-    "wrangler": "^3.99.0"
-  }}
-}}''')
 
-    create_file(root / "wrangler.toml", f'''"$schema" = "node_modules/wrangler/config-schema.json"
+_WRANGLER_TOML = '''"$schema" = "node_modules/wrangler/config-schema.json"
 name = "{project_name}"
 main = "src/index.ts"
 compatibility_date = "{today}"
@@ -97,9 +91,10 @@ id = "TODO-run-wrangler-kv-namespace-create-sessions"
 
 [vars]
 ENVIRONMENT = "development"
-''')
+'''
+
 
-    create_file(root / "tsconfig.json", '''{
+_TSCONFIG_JSON = '''{
   "compilerOptions": {
     "target": "ES2022",
     "module": "ESNext",
@@ -123,28 +118,30 @@ ENVIRONMENT = "development"
   },
   "include": ["src/**/*", "tests/**/*"],
   "exclude": ["node_modules", "dist"]
-}''')
+}
+'''
+
 
-    create_file(root / "vitest.config.ts", '''import { cloudflareTest } from "@cloudflare/vitest-pool-workers";
-import { defineConfig } from "vitest/config";
+_VITEST_CONFIG_TS = '''import {{ cloudflareTest }} from "@cloudflare/vitest-pool-workers";
+import {{ defineConfig }} from "vitest/config";
 
-export default defineConfig({
+export default defineConfig({{
   plugins: [
-    cloudflareTest({
-      wrangler: {
+    cloudflareTest({{
+      wrangler: {{
         configPath: "./wrangler.toml"
-      },
-      miniflare: {
-        compatibilityDate: "''' + today + '''",
+      }},
+      miniflare: {{
+        compatibilityDate: "{today}",
         compatibilityFlags: ["nodejs_compat"]
-      }
-    })
+      }}
+    }})
   ],
-  test: {
+  test: {{
     globals: true,
-    include: ["src/**/*.{spec,test}.ts", "tests/**/*.test.ts"],
+    include: ["src/**/*.{{spec,test}}.ts", "tests/**/*.test.ts"],
 
-    coverage: {
+    coverage: {{
       provider: "v8",
       reporter: ["text", "json", "html"],
       exclude: [
@@ -152,13 +149,13 @@ export default defineConfig({
         "**/*.spec.ts",
         "**/*.test.ts"
       ]
-    }
-  }
-});''')
+    }}
+  }}
+}});
+'''
 
-    # === TailwindCSS 4 + DaisyUI 5 ===
-    
-    create_file(root / "src" / "styles" / "app.css", '''@import "tailwindcss";
+
+_APP_CSS = '''@import "tailwindcss";
 @plugin "daisyui";
 
 /* Configure DaisyUI themes */
@@ -177,11 +174,11 @@ export default defineConfig({
   .htmx-request.htmx-indicator {
     opacity: 1;
   }
-}''')
+}
+'''
 
-    # === Public Assets (Static pages served by Cloudflare Pages) ===
 
-    create_file(root / "public" / "index.html", f'''<!DOCTYPE html>
+_INDEX_HTML = '''<!DOCTYPE html>
 <html lang="en" data-theme="light">
 <head>
   <meta charset="UTF-8">
@@ -203,43 +200,11 @@ export default defineConfig({
     </div>
   </div>
 </body>
-</html>''')
+</html>
+'''
 
-    create_file(root / "public" / "css" / ".gitkeep", "# Compiled CSS output directory")
 
-    create_file(root / "public" / "js" / ".gitkeep", '''# Add HTMX and Alpine.js here:
-# - htmx.min.js (from https://unpkg.com/htmx.org)
-# - alpine.min.js (from https://unpkg.com/alpinejs)''')
-
-    # === Domain Layer ===
-    
-    create_file(root / "src" / "domain" / "entities" / ".gitkeep", "# Domain entities (pure business objects)")
-    create_file(root / "src" / "domain" / "value-objects" / ".gitkeep", "# Value objects (immutable domain concepts)")
-    create_file(root / "src" / "domain" / "services" / ".gitkeep", "# Domain services (business logic)")
-    create_file(root / "src" / "domain" / "interfaces" / ".gitkeep", "# Port interfaces (repository contracts)")
-
-    # === Application Layer ===
-    
-    create_file(root / "src" / "application" / "use-cases" / ".gitkeep", "# Application use cases")
-    create_file(root / "src" / "application" / "dto" / ".gitkeep", "# Data transfer objects")
-
-    # === Infrastructure Layer ===
-    
-    create_file(root / "src" / "infrastructure" / "repositories" / ".gitkeep", "# D1 repository implementations")
-    create_file(root / "src" / "infrastructure" / "cache" / ".gitkeep", "# KV cache implementations")
-    create_file(root / "src" / "infrastructure" / "services" / ".gitkeep", "# External service adapters")
-
-    # === Presentation Layer ===
-
-    create_file(root / "src" / "presentation" / "handlers" / ".gitkeep", "# HTTP request handlers")
-    create_file(root / "src" / "presentation" / "templates" / "layouts" / ".gitkeep", "# Page layouts")
-    create_file(root / "src" / "presentation" / "templates" / "app" / ".gitkeep", "# Worker-rendered app pages (/app/*)")
-    create_file(root / "src" / "presentation" / "templates" / "app" / "partials" / ".gitkeep", "# HTMX partial templates (/app/_/*)")
-    create_file(root / "src" / "presentation" / "middleware" / ".gitkeep", "# Request middleware")
-
-    # === Entry Point & Hono App ===
-
-    create_file(root / "src" / "types" / "env.ts", '''/// <reference types="@cloudflare/workers-types" />
+_ENV_TS = '''/// <reference types="@cloudflare/workers-types" />
 
 export interface Env {
   readonly DB: D1Database;
@@ -247,15 +212,17 @@ export interface Env {
   readonly ASSETS: Fetcher;
   readonly ENVIRONMENT: string;
 }
-''')
+'''
 
-    create_file(root / "src" / "index.ts", '''/**
+
+_INDEX_TS = '''/**
  * Application entry point — re-exports the Hono Worker app.
  */
 export { default } from "./worker";
-''')
+'''
+
 
-    create_file(root / "src" / "worker.ts", '''import { Hono } from "hono/tiny";
+_WORKER_TS = '''import { Hono } from "hono/tiny";
 import type { Env } from "./types/env";
 
 type AppEnv = { Bindings: Env };
@@ -326,40 +293,145 @@ app.all("/app/_/*", (c) => c.json({ error: "Not found" }, 404));
 app.all("*", (c) => c.env.ASSETS.fetch(c.req.raw));
 
 export default app;
-''')
+'''
 
-    # === Tests ===
-    
-    create_file(root / "tests" / "setup.ts", '''// Test setup file
-// Add global test utilities here''')
-    
-    create_file(root / "tests" / "fixtures" / ".gitkeep", "# Test data builders")
-    create_file(root / "tests" / "helpers" / ".gitkeep", "# Test utilities")
 
-    # === Migrations ===
-    
-    create_file(root / "migrations" / ".gitkeep", "# D1 database migrations (0001_initial.sql, etc.)")
+_TEST_SETUP_TS = '''// Test setup file
+// Add global test utilities here
+'''
 
-    # === Git ===
-    
-    create_file(root / ".gitignore", '''node_modules/
+
+_GITIGNORE = '''node_modules/
 dist/
 .wrangler/
 .dev.vars
 *.log
 .DS_Store
 coverage/
-public/css/app.css''')
-
-    print(f"\n✅ Project scaffolded successfully!")
-    print(f"\nNext steps:")
-    print(f"  1. cd {project_name}")
-    print(f"  2. npm install")
-    print(f"  3. Download HTMX and Alpine.js to public/js/")
-    print(f"  4. npm run css:build")
-    print(f"  5. wrangler d1 create {db}")
-    print(f"  6. Update database_id in wrangler.toml")
-    print(f"  7. npm run dev")
+public/css/app.css
+'''
+
+
+def create_file(path: Path, content: str):
+    """Create a file with the given content; its directory must already exist."""
+    path.write_text(content)
+
+
+def scaffold_project(project_name: str, output_dir: Path, db_name: str = None):
+    """Generate the complete project structure."""
+    root = output_dir / project_name
+    db = db_name or f"{project_name}-db"
+    today = datetime.date.today().isoformat()
+    
+    sys.stdout.write(f"\n🚀 Scaffolding Cloudflare project: {project_name}\n   Output: {root}\n\n")
+
+    context = {"project_name": project_name, "db": db, "today": today}
+
+    # Every generated file as (path, content)
+    files = [
+        # === Configuration Files ===
+
+        (root / "package.json", _package_json(project_name, db)),
+
+        (root / "wrangler.toml", _WRANGLER_TOML.format_map(context)),
+
+        (root / "tsconfig.json", _TSCONFIG_JSON),
+
+        (root / "vitest.config.ts", _VITEST_CONFIG_TS.format_map(context)),
+
+        # === TailwindCSS 4 + DaisyUI 5 ===
+
+        (root / "src" / "styles" / "app.css", _APP_CSS),
+
+        # === Public Assets (Static pages served by Cloudflare Pages) ===
+
+        (root / "public" / "index.html", _INDEX_HTML.format_map(context)),
+
+        (root / "public" / "css" / ".gitkeep", "# Compiled CSS output directory\n"),
+
+        (root / "public" / "js" / ".gitkeep", '''# Add HTMX and Alpine.js here:
+# - htmx.min.js (from https://unpkg.com/htmx.org)
+# - alpine.min.js (from https://unpkg.com/alpinejs)
+'''),
+
+        # === Domain Layer ===
+
+        (root / "src" / "domain" / "entities" / ".gitkeep", "# Domain entities (pure business objects)\n"),
+        (root / "src" / "domain" / "value-objects" / ".gitkeep", "# Value objects (immutable domain concepts)\n"),
+        (root / "src" / "domain" / "services" / ".gitkeep", "# Domain services (business logic)\n"),
+        (root / "src" / "domain" / "interfaces" / ".gitkeep", "# Port interfaces (repository contracts)\n"),
+
+        # === Application Layer ===
+
+        (root / "src" / "application" / "use-cases" / ".gitkeep", "# Application use cases\n"),
+        (root / "src" / "application" / "dto" / ".gitkeep", "# Data transfer objects\n"),
+
+        # === Infrastructure Layer ===
+
+        (root / "src" / "infrastructure" / "repositories" / ".gitkeep", "# D1 repository implementations\n"),
+        (root / "src" / "infrastructure" / "cache" / ".gitkeep", "# KV cache implementations\n"),
+        (root / "src" / "infrastructure" / "services" / ".gitkeep", "# External service adapters\n"),
+
+        # === Presentation Layer ===
+
+        (root / "src" / "presentation" / "handlers" / ".gitkeep", "# HTTP request handlers\n"),
+        (root / "src" / "presentation" / "templates" / "layouts" / ".gitkeep", "# Page layouts\n"),
+        (root / "src" / "presentation" / "templates" / "app" / ".gitkeep", "# Worker-rendered app pages (/app/*)\n"),
+        (root / "src" / "presentation" / "templates" / "app" / "partials" / ".gitkeep", "# HTMX partial templates (/app/_/*)\n"),
+        (root / "src" / "presentation" / "middleware" / ".gitkeep", "# Request middleware\n"),
+
+        # === Entry Point & Hono App ===
+
+        (root / "src" / "types" / "env.ts", _ENV_TS),
+
+        (root / "src" / "index.ts", _INDEX_TS),
+
+        (root / "src" / "worker.ts", _WORKER_TS),
+
+        # === Tests ===
+
+        (root / "tests" / "setup.ts", _TEST_SETUP_TS),
+
+        (root / "tests" / "fixtures" / ".gitkeep", "# Test data builders\n"),
+        (root / "tests" / "helpers" / ".gitkeep", "# Test utilities\n"),
+
+        # === Migrations ===
+
+        (root / "migrations" / ".gitkeep", "# D1 database migrations (0001_initial.sql, etc.)\n"),
+
+        # === Git ===
+
+        (root / ".gitignore", _GITIGNORE),
+    ]
+
+    # Create directories serially so writer threads never race on parents.
+    # Only leaf directories need a makedirs call; it creates their ancestors.
+    parents = {path.parent for path, _ in files}
+    ancestors = {ancestor for parent in parents for ancestor in parent.parents}
+    for parent in parents:
+        if parent not in ancestors:
+            os.makedirs(parent, exist_ok=True)
+
+    # Writes are independent and I/O-bound, so run them concurrently
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda item: create_file(*item), files))
+
+    # Progress and next steps are written in one batch once all files exist
+    lines = [f"  ✓ {path}" for path, _ in files]
+    lines += [
+        "",
+        "✅ Project scaffolded successfully!",
+        "",
+        "Next steps:",
+        f"  1. cd {project_name}",
+        "  2. npm install",
+        "  3. Download HTMX and Alpine.js to public/js/",
+        "  4. npm run css:build",
+        f"  5. wrangler d1 create {db}",
+        "  6. Update database_id in wrangler.toml",
+        "  7. npm run dev",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -13,9 +13,31 @@ Usage:
 import re
 import sys
 import math
+import functools
 from dataclasses import dataclass
 from typing import Optional
 
+# --color-<name>: oklch(L[%] C H), captured in a single pass
+_COLOR_RE = re.compile(
+    r"--color-([\w-]+)\s*:\s*oklch\(\s*([\d.]+)(%?)\s+([\d.]+)\s+([\d.]+)\s*\)",
+    re.IGNORECASE,
+)
+
+# Characters allowed in an OKLCH component (unsigned decimal)
+_NUMBER_CHARS = frozenset("0123456789.")
+
+# sRGB transfer function constants (reciprocals avoid per-channel division)
+_SRGB_THRESHOLD = 0.03928
+_INV_12_92 = 1 / 12.92
+_INV_1_055 = 1 / 1.055
+
+
+def _channel_luminance(c: float) -> float:
+    """Linearize a single sRGB channel."""
+    if c <= _SRGB_THRESHOLD:
+        return c * _INV_12_92
+    return math.pow((c + 0.055) * _INV_1_055, 2.4)
+
 
 @dataclass
 class OklchColor:
@@ -26,18 +48,42 @@ class OklchColor:
 
     @classmethod
     def parse(cls, value: str) -> Optional["OklchColor"]:
-        """Parse oklch(L% C H) or oklch(L C H) format."""
-        match = re.search(
-            r"oklch\(\s*([\d.]+)(%?)\s+([\d.]+)\s+([\d.]+)\s*\)",
-            value.strip(),
-            re.IGNORECASE,
-        )
-        if not match:
+        """Parse oklch(L% C H) or oklch(L C H) format.
+
+        Text around the oklch(...) value is ignored, including non-ASCII
+        characters whose lowercase form changes length:
+
+        >>> OklchColor.parse("İ oklch(50% 0.1 20);")
+        OklchColor(l=0.5, c=0.1, h=20.0)
+        """
+        # Search and slice the same lowered string so offsets stay aligned;
+        # lowercasing leaves digits, '.', '%' and whitespace unchanged
+        lowered = value.lower()
+        start = lowered.find("oklch(")
+        if start == -1:
             return None
-        l_val = float(match.group(1))
-        if match.group(2) == "%":
+        end = lowered.find(")", start)
+        if end == -1:
+            return None
+        parts = lowered[start + 6:end].split()
+        if len(parts) != 3:
+            return None
+        l_raw, c_raw, h_raw = parts
+        percent = l_raw.endswith("%")
+        if percent:
+            l_raw = l_raw[:-1]
+        # Only plain unsigned decimals; rejects signs, exponents, nan and inf
+        if not all(raw and _NUMBER_CHARS.issuperset(raw) for raw in (l_raw, c_raw, h_raw)):
+            return None
+        try:
+            l_val = float(l_raw)
+            c_val = float(c_raw)
+            h_val = float(h_raw)
+        except ValueError:
+            return None
+        if percent:
             l_val /= 100
-        return cls(l=l_val, c=float(match.group(3)), h=float(match.group(4)))
+        return cls(l=l_val, c=c_val, h=h_val)
 
     def to_srgb(self) -> tuple[float, float, float]:
         """Convert OKLCH to linear sRGB (approximate)."""
@@ -56,9 +102,9 @@ class OklchColor:
         m_ = self.l - 0.1055613458 * a - 0.0638541728 * b
         s_ = self.l - 0.0894841775 * a - 1.2914855480 * b
         
-        l = l_ ** 3
-        m = m_ ** 3
-        s = s_ ** 3
+        l = l_ * l_ * l_
+        m = m_ * m_ * m_
+        s = s_ * s_ * s_
         
         r = 4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s
         g = -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s
@@ -68,29 +114,35 @@ class OklchColor:
 
     def relative_luminance(self) -> float:
         """Calculate relative luminance for contrast ratio."""
-        r, g, b = self.to_srgb()
-        
-        def channel_luminance(c: float) -> float:
-            if c <= 0.03928:
-                return c / 12.92
-            return ((c + 0.055) / 1.055) ** 2.4
-        
-        return (
-            0.2126 * channel_luminance(r)
-            + 0.7152 * channel_luminance(g)
-            + 0.0722 * channel_luminance(b)
-        )
+        return _luminance(self.l, self.c, self.h)
 
 
-def contrast_ratio(color1: OklchColor, color2: OklchColor) -> float:
-    """Calculate WCAG contrast ratio between two colors."""
-    l1 = color1.relative_luminance()
-    l2 = color2.relative_luminance()
+@functools.lru_cache(maxsize=256)
+def _luminance(l: float, c: float, h: float) -> float:
+    """Relative luminance of an OKLCH color, cached by component values."""
+    if c < 0.001:
+        # Achromatic: all channels equal and the weights sum to 1
+        return _channel_luminance(l)
+    r, g, b = OklchColor(l=l, c=c, h=h).to_srgb()
+    return (
+        0.2126 * _channel_luminance(r)
+        + 0.7152 * _channel_luminance(g)
+        + 0.0722 * _channel_luminance(b)
+    )
+
+
+def luminance_contrast(l1: float, l2: float) -> float:
+    """Calculate WCAG contrast ratio between two relative luminances."""
     lighter = max(l1, l2)
     darker = min(l1, l2)
     return (lighter + 0.05) / (darker + 0.05)
 
 
+def contrast_ratio(color1: OklchColor, color2: OklchColor) -> float:
+    """Calculate WCAG contrast ratio between two colors."""
+    return luminance_contrast(color1.relative_luminance(), color2.relative_luminance())
+
+
 def check_aaa(ratio: float, large_text: bool = False) -> tuple[bool, str]:
     """Check if contrast ratio meets WCAG AAA."""
     threshold = 4.5 if large_text else 7.0
@@ -118,27 +170,35 @@ COLOR_PAIRS = [
 def parse_theme_css(css_content: str) -> dict[str, OklchColor]:
     """Extract color variables from DaisyUI theme CSS."""
     colors = {}
-    pattern = r"--color-([\w-]+):\s*(oklch\([^)]+\))"
-    for match in re.finditer(pattern, css_content, re.IGNORECASE):
-        name = match.group(1)
-        color = OklchColor.parse(match.group(2))
-        if color:
-            colors[name] = color
+    for match in _COLOR_RE.finditer(css_content):
+        name, l_raw, percent, c_raw, h_raw = match.groups()
+        l_val = float(l_raw)
+        if percent:
+            l_val /= 100
+        colors[name] = OklchColor(l=l_val, c=float(c_raw), h=float(h_raw))
     return colors
 
 
 def validate_theme(css_content: str) -> list[dict]:
     """Validate all color pairs in a theme."""
-    colors = parse_theme_css(css_content)
+    return validate_colors(parse_theme_css(css_content))
+
+
+def validate_colors(colors: dict[str, OklchColor]) -> list[dict]:
+    """Validate all color pairs in a set of parsed theme colors."""
+    # Each color appears in several pairs; compute its luminance once
+    luminance = [color.relative_luminance() for color in colors.values()]
+    name_to_idx = {name: i for i, name in enumerate(colors)}
+    # Resolve the pairs present in this theme to luminance indices up front
+    pairs_idx = [
+        (bg_name, fg_name, name_to_idx[bg_name], name_to_idx[fg_name])
+        for bg_name, fg_name in COLOR_PAIRS
+        if bg_name in name_to_idx and fg_name in name_to_idx
+    ]
     results = []
     
-    for bg_name, fg_name in COLOR_PAIRS:
-        if bg_name not in colors or fg_name not in colors:
-            continue
-        
-        bg = colors[bg_name]
-        fg = colors[fg_name]
-        ratio = contrast_ratio(bg, fg)
+    for bg_name, fg_name, bg_i, fg_i in pairs_idx:
+        ratio = luminance_contrast(luminance[bg_i], luminance[fg_i])
         passed, status = check_aaa(ratio)
         
         results.append({